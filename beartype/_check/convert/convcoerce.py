@@ -56,9 +56,13 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                            }....................
 from beartype.typing import (
     Any,
+    Dict,
     Union,
 )
-from beartype._cave._cavefast import NotImplementedType
+from beartype._cave._cavefast import (
+    NoneType,
+    NotImplementedType,
+)
 from beartype._data.func.datafuncarg import ARG_NAME_RETURN
 from beartype._data.func.datafunc import METHOD_NAMES_DUNDER_BINARY
 from beartype._check.checkcall import BeartypeCall
@@ -67,6 +71,11 @@ from beartype._util.cache.map.utilmapbig import CacheUnboundedStrong
 from beartype._util.hint.utilhinttest import is_hint_uncached
 from beartype._util.hint.pep.proposal.pep484.utilpep484union import (
     make_hint_pep484_union)
+from typing import (
+    List as typing_List,
+    Literal as typing_Literal,
+    Union as typing_Union,
+)
 
 # ....................{ COERCERS ~ root                    }....................
 #FIXME: Document mypy-specific coercion in the docstring as well, please.
@@ -124,9 +133,12 @@ def coerce_func_hint_root(
           type hint coerced from this hint.
         * Else, this hint as is unmodified.
     '''
-    assert isinstance(arg_name, str), f'{repr(arg_name)} not string.'
-    assert bear_call.__class__ is BeartypeCall, (
-        f'{repr(bear_call)} not @beartype call.')
+    # Note that these assertions are intentionally disabled. This coercer is
+    # called once for each parameter and return of each decorated callable by
+    # callers already guaranteeing these invariants.
+    # assert isinstance(arg_name, str), f'{repr(arg_name)} not string.'
+    # assert bear_call.__class__ is BeartypeCall, (
+    #     f'{repr(bear_call)} not @beartype call.')
 
     # ..................{ FORWARD REFERENCE                  }..................
     # If this hint is stringified (e.g., as a PEP 484- or 563-compliant forward
@@ -389,6 +401,44 @@ def coerce_hint_any(hint: object) -> Any:
         * Else, this hint as is unmodified.
     '''
 
+    # ..................{ SINGLETON                          }..................
+    # If this hint is the singleton copy of a non-self-caching hint previously
+    # cached by a prior call to this function, this hint is already coerced.
+    # In this case, return this hint as is.
+    #
+    # Note this technically constitutes an optional (albeit pragmatically
+    # critical) optimization. This test is O(1) with negligible constants,
+    # whereas the tests below are O(n) with non-negligible constants for n the
+    # length of the machine-readable representation of this hint. Ergo, this
+    # efficient test short-circuits the inefficient tests below for the common
+    # case of repeatedly passed hints (e.g., hints shared between callables).
+    #
+    # Note that this identity-based cache is guaranteed to be safe. Since the
+    # "_HINT_REPR_TO_SINGLETON" cache strongly refers to *ALL* hints cached
+    # by this cache, these hints are *NEVER* garbage-collected. Ergo, the
+    # object identifiers of these hints are *NEVER* reused by other objects.
+    if _HINT_ID_TO_SINGLETON_get(id(hint)) is hint:
+        return hint
+    # Else, this hint is *NOT* the singleton copy of a previously cached hint.
+
+    # ..................{ SELF-CACHING                       }..................
+    # If the type of this hint is known to *ONLY* produce self-caching hints
+    # (e.g., types, "typing.Union[...]" subscriptions), return this hint as is.
+    # This test is O(1) with negligible constants, short-circuiting the
+    # function calls performed by the is_hint_uncached() tester below for the
+    # overwhelmingly common case of such hints.
+    #
+    # Note that the type of this hint is intentionally obtained by calling the
+    # type() builtin rather than accessing the "hint.__class__" dunder
+    # attribute. Under Python <= 3.10, the PEP 585-compliant "GenericAlias"
+    # type proxies the "__class__" attribute to its origin type. Ergo,
+    # "list[int].__class__ is type" under those Python versions, which would
+    # erroneously misidentify *ALL* PEP 585 type hints as self-caching types.
+    if type(hint) in _HINT_TYPES_SELF_CACHING:
+        return hint
+    # Else, the type of this hint is *NOT* known to only produce self-caching
+    # hints.
+
     # ..................{ NON-SELF-CACHING                   }..................
     # If this hint is *NOT* self-caching, this hint *MUST* thus be explicitly
     # cached here. Failing to do so would disable subsequent memoization,
@@ -402,15 +452,76 @@ def coerce_hint_any(hint: object) -> Any:
     #   this function. In this case, replace this subsequent copy by the first
     #   copy of this hint originally passed to a prior call of this function.
     if is_hint_uncached(hint):
-        return _HINT_REPR_TO_SINGLETON.cache_or_get_cached_value(
+        # Singleton copy of this hint cached under its machine-readable
+        # representation.
+        hint = _HINT_REPR_TO_SINGLETON.cache_or_get_cached_value(
             key=repr(hint), value=hint)
-        # return _HINT_REPR_TO_SINGLETON.cache_or_get_cached_value(key=repr(hint), value=hint)
+
+        # Map the object identifier of this singleton onto this singleton,
+        # enabling the efficient identity test above to short-circuit
+        # subsequent calls passed this singleton. Since dictionary assignment
+        # is atomic under the GIL, this assignment is implicitly thread-safe.
+        _HINT_ID_TO_SINGLETON[id(hint)] = hint
     # Else, this hint is (hopefully) self-caching.
 
     # Return this uncoerced hint as is.
     return hint
 
+# ....................{ PRIVATE ~ sets                     }....................
+_HINT_TYPES_SELF_CACHING = frozenset((
+    # Types of PEP-noncompliant isinstanceable classes and "None".
+    type,
+    NoneType,
+
+    # Types of self-caching "typing" hints, intentionally derived from public
+    # "typing" attributes rather than private "typing" types whose names vary
+    # across Python versions. Note that these are the stdlib "typing" rather
+    # than "beartype.typing" attributes, as the latter may be PEP 585-compliant
+    # builtin types under newer Python versions.
+    typing_List.__class__,
+    typing_Literal[True].__class__,
+    typing_Union[int, str].__class__,
+))
+'''
+Frozen set of all **self-caching hint types** (i.e., types whose instances are
+type hints that are either *not* subscripted or internally cache themselves on
+subscription and thus need *not* be cached by the :func:`.coerce_hint_any`
+coercer).
+
+This set intentionally excludes the type of :pep:`484`-compliant subscripted
+generics (e.g., ``typing.List[int]``), as user-defined :pep:`484`-compliant
+generics subscripted under Python >= 3.9 are *not* necessarily self-caching.
+See the :func:`.coerce_hint_any` docstring for further details.
+
+Under Python 3.8, the types of *all* :mod:`typing` hints collapse into the same
+private ``typing._GenericAlias`` type, which this set then necessarily
+includes. Since the :func:`.is_hint_uncached` tester already returns false for
+*all* :mod:`typing` hints, this collapse preserves existing behaviour.
+'''
+
 # ....................{ PRIVATE ~ mappings                 }....................
+_HINT_ID_TO_SINGLETON: Dict[int, object] = {}
+'''
+**Type hint identity cache** (i.e., dictionary mapping from the object
+identifiers of all non-self-cached type hints previously cached by the
+:data:`._HINT_REPR_TO_SINGLETON` cache to those hints).
+
+This cache enables the :func:`.coerce_hint_any` coercer to efficiently detect
+previously coerced hints by object identity *without* recomputing the
+machine-readable representations of those hints. Since
+:data:`._HINT_REPR_TO_SINGLETON` strongly refers to *all* hints cached here,
+the object identifiers cached here are guaranteed to *never* be reused by other
+objects.
+'''
+
+
+_HINT_ID_TO_SINGLETON_get = _HINT_ID_TO_SINGLETON.get
+'''
+:meth:`dict.get` method bound to the :data:`._HINT_ID_TO_SINGLETON` cache,
+globalized for negligible efficiency.
+'''
+
+
 _HINT_REPR_TO_SINGLETON = CacheUnboundedStrong()
 '''
 **Type hint cache** (i.e., thread-safe cache mapping from the machine-readable
@@ -457,6 +568,16 @@ rather than the :func:`functools.lru_cache` decorator. Why? Because:
   temporarily caching hints in an LRU cache is pointless, as there are *no*
   space savings in dropping stale references to unused hints.
 
+**This dictionary is intentionally unbounded** (e.g., rather than a bounded
+generational cache evicting infrequently accessed hints), for the same reasons
+as above *and* because correctness requires as much. The
+:data:`._HINT_ID_TO_SINGLETON` cache assumes the singletons cached here to
+*never* be garbage-collected and thus their object identifiers to *never* be
+reused. Likewise, memoized callables throughout the :mod:`beartype` codebase
+assume semantically equivalent hints to be coerced into the *same* singleton
+across the lifetime of the active Python process. Evicting singletons would
+violate both assumptions.
+
 **This dictionary intentionally caches machine-readable representation strings
 hashes rather than alternative keys** (e.g., actual hashes). Why? Disambiguity.
 Although comparatively less efficient in both space and time to construct than
@@ -25,7 +25,6 @@ from beartype._check.convert.convcoerce import (
 from beartype._check.convert.convreduce import reduce_hint
 from beartype._conf.confcls import BeartypeConf
 from beartype._data.hint.datahinttyping import TypeStack
-from beartype._util.cache.map.utilmapbig import CacheUnboundedStrong
 from beartype._util.error.utilerror import EXCEPTION_PLACEHOLDER
 
 # ....................{ SANIFIERS ~ root                   }....................
@@ -123,7 +122,13 @@ def sanify_hint_root_func(
     # PEP-noncompliant type hint if this hint is coercible *OR* this hint as is
     # otherwise. Since the passed hint is *NOT* necessarily PEP-compliant,
     # perform this coercion *BEFORE* validating this hint to be PEP-compliant.
-    hint = bear_call.func_wrappee.__annotations__[arg_name] = (
+    #
+    # Note that the "bear_call.func_arg_name_to_hint" dictionary is the
+    # "__annotations__" dunder dictionary of this callable, previously
+    # classified by the BeartypeCall.reinit() method. Accessing that dictionary
+    # directly avoids needlessly re-resolving the "__annotations__" dunder
+    # attribute, which is a non-trivial descriptor under Python >= 3.10.
+    hint = bear_call.func_arg_name_to_hint[arg_name] = (
         coerce_func_hint_root(
             hint=hint,
             arg_name=arg_name,
@@ -311,49 +316,3 @@ def sanify_hint_any(
         arg_name=arg_name,
         exception_prefix=exception_prefix,
     )
-
-# ....................{ PRIVATE ~ mappings                 }....................
-_HINT_REPR_TO_HINT = CacheUnboundedStrong()
-'''
-**Type hint cache** (i.e., thread-safe cache mapping from the machine-readable
-representations of all non-self-cached type hints to those hints).**
-
-This cache caches:
-
-* :pep:`585`-compliant type hints, which do *not* cache themselves.
-
-This cache does *not* cache:
-
-* Type hints declared by the :mod:`typing` module, which implicitly cache
-  themselves on subscription thanks to inscrutable metaclass magic.
-* :pep:`563`-compliant **deferred type hints** (i.e., type hints persisted as
-  evaluable strings rather than actual type hints). Ideally, this cache would
-  cache the evaluations of *all* deferred type hints. Sadly, doing so is
-  infeasible in the general case due to global and local namespace lookups
-  (e.g., ``Dict[str, int]`` only means what you think it means if an
-  importation resembling ``from typing import Dict`` preceded that type hint).
-
-Design
---------------
-**This dictionary is intentionally thread-safe.** Why? Because this dictionary
-is used to modify the ``__attributes__`` dunder variable of arbitrary callables.
-Since most of those callables are either module- or class-scoped, that variable
-is effectively global. To prevent race conditions between competing threads
-contending over that global variable, this dictionary *must* be thread-safe.
-
-This dictionary is intentionally designed as a naive dictionary rather than a
-robust LRU cache, for the same reasons that callables accepting hints are
-memoized by the :func:`beartype._util.cache.utilcachecall.callable_cached`
-rather than the :func:`functools.lru_cache` decorator. Why? Because:
-
-* The number of different type hints instantiated across even worst-case
-  codebases is negligible in comparison to the space consumed by those hints.
-* The :attr:`sys.modules` dictionary persists strong references to all
-  callables declared by previously imported modules. In turn, the
-  ``func.__annotations__`` dunder dictionary of each such callable persists
-  strong references to all type hints annotating that callable. In turn, these
-  two statements imply that type hints are *never* garbage collected but
-  instead persisted for the lifetime of the active Python process. Ergo,
-  temporarily caching hints in an LRU cache is pointless, as there are *no*
-  space savings in dropping stale references to unused hints.
-'''
@@ -66,6 +66,9 @@ class CacheUnboundedStrong(object):
     _key_to_value_set : Callable
         The :meth:`self._key_to_value.__setitem__` dunder method, classified
         for efficiency.
+    _key_to_value_setdefault : Callable
+        The :meth:`self._key_to_value.setdefault` method, classified for
+        efficiency.
     _lock : AbstractContextManager
         **Instance-specific thread lock** (i.e., low-level thread locking
         mechanism implemented as a highly efficient C extension, defined as an
@@ -86,6 +89,7 @@ class CacheUnboundedStrong(object):
         '_key_to_value',
         '_key_to_value_get',
         '_key_to_value_set',
+        '_key_to_value_setdefault',
         '_lock',
     )
 
@@ -111,19 +115,11 @@ class CacheUnboundedStrong(object):
         self._key_to_value: Dict[Hashable, object] = {}
         self._key_to_value_get = self._key_to_value.get
         self._key_to_value_set = self._key_to_value.__setitem__
+        self._key_to_value_setdefault = self._key_to_value.setdefault
         self._lock: AbstractContextManager = lock_type()  # type: ignore[assignment]
 
     # ..................{ GETTERS                            }..................
-    def cache_or_get_cached_value(
-        self,
-
-        # Mandatory parameters.
-        key: Hashable,
-        value: object,
-
-        # Hidden parameters, localized for negligible efficiency.
-        _SENTINEL=SENTINEL,
-    ) -> object:
+    def cache_or_get_cached_value(self, key: Hashable, value: object) -> object:
         '''
         **Statically** (i.e., non-dynamically, rather than "statically" in the
         different semantic sense of "static" methods) associate the passed key
@@ -147,22 +143,15 @@ class CacheUnboundedStrong(object):
         '''
         # assert isinstance(key, Hashable), f'{repr(key)} unhashable.'
 
-        # Thread-safely (but non-reentrantly)...
+        # Thread-safely (but non-reentrantly) return either the value
+        # previously cached under this key if any *OR* this value otherwise,
+        # caching this key with this value in the latter case.
+        #
+        # Note that dict.setdefault() both tests for and adds this key in a
+        # single dictionary probe, avoiding the separate dict.get() and
+        # dict.__setitem__() calls otherwise required to do so.
         with self._lock:
-            # Value previously cached under this key if any *OR* the sentinel
-            # placeholder otherwise.
-            value_old = self._key_to_value_get(key, _SENTINEL)
-
-            # If this key has already been cached, return this value as is.
-            if value_old is not _SENTINEL:
-                return value_old
-            # Else, this key has yet to be cached.
-
-            # Cache this key with this value.
-            self._key_to_value_set(key, value)
-
-            # Return this value.
-            return value
+            return self._key_to_value_setdefault(key, value)
 
 
     #FIXME: Unit test us up.
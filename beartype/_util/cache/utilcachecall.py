@@ -29,7 +29,6 @@ from beartype._util.func.arg.utilfuncargtest import (
     is_func_arg_variadic,
 )
 from beartype._util.text.utiltextlabel import label_callable
-from beartype._util.utilobject import SENTINEL
 from collections.abc import Callable
 from functools import wraps
 
@@ -63,10 +62,10 @@ def callable_cached(func: _CallableT) -> _CallableT:
        #. Tests whether this callable has already been called at least once
           with the passed parameters by lookup of those parameters in these
           dictionaries.
-       #. If this callable previously raised an exception when passed these
+       #. If this callable previously returned a value when passed these
+          parameters, this wrapper re-returns the same value.
+       #. Else if this callable raised an exception when passed these
           parameters, this wrapper re-raises the same exception.
-       #. Else if this callable returned a value when passed these parameters,
-          this wrapper re-returns the same value.
        #. Else, this wrapper:
 
           #. Calls that callable with those parameters.
@@ -170,9 +169,6 @@ def callable_cached(func: _CallableT) -> _CallableT:
     # if any (i.e., if that call did *NOT* raise an exception).
     args_flat_to_return_value: Dict[tuple, object] = {}
 
-    # get() method of this dictionary, localized for efficiency.
-    args_flat_to_return_value_get = args_flat_to_return_value.get
-
     # Dictionary mapping a tuple of all flattened parameters passed to each
     # prior call of the decorated callable with the exception raised by that
     # call if any (i.e., if that call raised an exception).
@@ -208,40 +204,48 @@ def callable_cached(func: _CallableT) -> _CallableT:
 
         # Attempt to...
         try:
-            # Exception raised by a prior call to the decorated callable when
-            # passed these parameters *OR* the sentinel placeholder otherwise
-            # (i.e., if this callable either has yet to be called with these
-            # parameters *OR* has but failed to raise an exception).
+            # Attempt to return the value returned by a prior call to the
+            # decorated callable when passed these parameters.
             #
             # Note that:
             # * This statement raises a "TypeError" exception if any item of
             #   this flattened tuple is unhashable.
-            # * A sentinel placeholder (e.g., "SENTINEL") is *NOT* needed here.
-            #   The values of the "args_flat_to_exception" dictionary are
-            #   guaranteed to *ALL* be exceptions. Since "None" is *NOT* an
-            #   exception, disambiguation between "None" and valid dictionary
-            #   values is *NOT* needed here. Although a sentinel placeholder
-            #   could still be employed, doing so would slightly reduce
-            #   efficiency for *NO* real-world gain.
+            # * This dictionary is intentionally looked up *BEFORE* the
+            #   "args_flat_to_exception" dictionary below. Since the common
+            #   case is a cache hit against a previously returned value, doing
+            #   so avoids needlessly rehashing these parameters in that case.
+            #   Hashing type hints is non-trivial (e.g., "typing.List[int]"
+            #   recursively hashes its origin and arguments on each call).
+            # * This dictionary is intentionally subscripted directly rather
+            #   than passed a sentinel placeholder via the dict.get() method.
+            #   Since the common case is a cache hit, doing so avoids both a
+            #   method call and a sentinel comparison in that case at the
+            #   negligible cost of raising and catching a "KeyError" exception
+            #   once for each cache miss.
+            try:
+                return args_flat_to_return_value[args_flat]
+            # If this callable has yet to successfully return a value when
+            # called with these parameters, silently continue below.
+            except KeyError:
+                pass
+
+            # Exception raised by a prior call to the decorated callable when
+            # passed these parameters *OR* "None" otherwise (i.e., if this
+            # callable has yet to be called with these parameters).
+            #
+            # Note that a sentinel placeholder (e.g., "SENTINEL") is *NOT*
+            # needed here. The values of the "args_flat_to_exception"
+            # dictionary are guaranteed to *ALL* be exceptions. Since "None" is
+            # *NOT* an exception, disambiguation between "None" and valid
+            # dictionary values is *NOT* needed here. Although a sentinel
+            # placeholder could still be employed, doing so would slightly
+            # reduce efficiency for *NO* real-world gain.
             exception = args_flat_to_exception_get(args_flat)
 
             # If this callable previously raised an exception when called with
             # these parameters, re-raise the same exception.
             if exception:
                 raise exception  # pyright: ignore[reportGeneralTypeIssues]
-            # Else, this callable either has yet to be called with these
-            # parameters *OR* has but failed to raise an exception.
-
-            # Value returned by a prior call to the decorated callable when
-            # passed these parameters *OR* a sentinel placeholder otherwise
-            # (i.e., if this callable has yet to be passed these parameters).
-            return_value = args_flat_to_return_value_get(
-                args_flat, SENTINEL)
-
-            # If this callable has already been called with these parameters,
-            # return the value returned by that prior call.
-            if return_value is not SENTINEL:
-                return return_value
             # Else, this callable has yet to be called with these parameters.
 
             # Attempt to...
@@ -393,9 +397,6 @@ def method_cached_arg_by_id(func: _CallableT) -> _CallableT:
     # if any (i.e., if that call did *NOT* raise an exception).
     args_flat_to_return_value: Dict[tuple, object] = {}
 
-    # get() method of this dictionary, localized for efficiency.
-    args_flat_to_return_value_get = args_flat_to_return_value.get
-
     # Dictionary mapping a tuple of all flattened parameters passed to each
     # prior call of the decorated callable with the exception raised by that
     # call if any (i.e., if that call raised an exception).
@@ -421,40 +422,48 @@ def method_cached_arg_by_id(func: _CallableT) -> _CallableT:
 
         # Attempt to...
         try:
-            # Exception raised by a prior call to the decorated callable when
-            # passed these parameters *OR* the sentinel placeholder otherwise
-            # (i.e., if this callable either has yet to be called with these
-            # parameters *OR* has but failed to raise an exception).
+            # Attempt to return the value returned by a prior call to the
+            # decorated callable when passed these parameters.
             #
             # Note that:
             # * This statement raises a "TypeError" exception if any item of
             #   this flattened tuple is unhashable.
-            # * A sentinel placeholder (e.g., "SENTINEL") is *NOT* needed here.
-            #   The values of the "args_flat_to_exception" dictionary are
-            #   guaranteed to *ALL* be exceptions. Since "None" is *NOT* an
-            #   exception, disambiguation between "None" and valid dictionary
-            #   values is *NOT* needed here. Although a sentinel placeholder
-            #   could still be employed, doing so would slightly reduce
-            #   efficiency for *NO* real-world gain.
+            # * This dictionary is intentionally looked up *BEFORE* the
+            #   "args_flat_to_exception" dictionary below. Since the common
+            #   case is a cache hit against a previously returned value, doing
+            #   so avoids needlessly rehashing these parameters in that case.
+            #   Hashing type hints is non-trivial (e.g., "typing.List[int]"
+            #   recursively hashes its origin and arguments on each call).
+            # * This dictionary is intentionally subscripted directly rather
+            #   than passed a sentinel placeholder via the dict.get() method.
+            #   Since the common case is a cache hit, doing so avoids both a
+            #   method call and a sentinel comparison in that case at the
+            #   negligible cost of raising and catching a "KeyError" exception
+            #   once for each cache miss.
+            try:
+                return args_flat_to_return_value[args_flat]
+            # If this callable has yet to successfully return a value when
+            # called with these parameters, silently continue below.
+            except KeyError:
+                pass
+
+            # Exception raised by a prior call to the decorated callable when
+            # passed these parameters *OR* "None" otherwise (i.e., if this
+            # callable has yet to be called with these parameters).
+            #
+            # Note that a sentinel placeholder (e.g., "SENTINEL") is *NOT*
+            # needed here. The values of the "args_flat_to_exception"
+            # dictionary are guaranteed to *ALL* be exceptions. Since "None" is
+            # *NOT* an exception, disambiguation between "None" and valid
+            # dictionary values is *NOT* needed here. Although a sentinel
+            # placeholder could still be employed, doing so would slightly
+            # reduce efficiency for *NO* real-world gain.
             exception = args_flat_to_exception_get(args_flat)
 
             # If this callable previously raised an exception when called with
             # these parameters, re-raise the same exception.
             if exception:
                 raise exception  # pyright: ignore[reportGeneralTypeIssues]
-            # Else, this callable either has yet to be called with these
-            # parameters *OR* has but failed to raise an exception.
-
-            # Value returned by a prior call to the decorated callable when
-            # passed these parameters *OR* a sentinel placeholder otherwise
-            # (i.e., if this callable has yet to be passed these parameters).
-            return_value = args_flat_to_return_value_get(
-                args_flat, SENTINEL)
-
-            # If this callable has already been called with these parameters,
-            # return the value returned by that prior call.
-            if return_value is not SENTINEL:
-                return return_value
             # Else, this callable has yet to be called with these parameters.
 
             # Attempt to...
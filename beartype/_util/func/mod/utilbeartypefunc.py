@@ -12,8 +12,7 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                            }....................
-from beartype._util.func.pep.utilpep484func import (
-    is_func_pep484_notypechecked)
+from beartype._data.kind.datakinddict import DICT_EMPTY
 from beartype._util.module.lib.utilsphinx import is_sphinx_autodocing
 from collections.abc import Callable
 
@@ -26,6 +25,22 @@ def is_func_unbeartypeable(func: Callable) -> bool:
     reducing to the identity decorator rather than wrap that callable with
     constant-time type-checking).
 
+    This tester is intentionally *not* memoized (e.g., by a
+    :class:`weakref.WeakKeyDictionary` keyed on the passed callable), as the
+    result of this tester is *not* guaranteed to be constant across calls
+    passed the same callable. Notably:
+
+    * The :func:`beartype.beartype` decorator itself applies the
+      :func:`typing.no_type_check` decorator to callables decorated under the
+      no-time strategy (i.e., :attr:`beartype.BeartypeStrategy.O0`) *before*
+      calling this tester, which must then detect that change.
+    * The :func:`.is_sphinx_autodocing` tester depends on the current call
+      stack rather than the passed callable.
+
+    Since the tests performed by this tester reduce to a small number of
+    :math:`O(1)` attribute and dictionary lookups in the common case, the cost
+    of memoizing this tester would largely offset any benefit.
+
     Parameters
     ----------
     func : Callable
@@ -38,6 +53,9 @@ def is_func_unbeartypeable(func: Callable) -> bool:
     '''
 
     # Return true only if either...
+    #
+    # Note that these tests are intentionally ordered from least to most costly,
+    # maximizing the efficiency of short-circuiting.
     return (
         # This callable is unannotated *OR*...
         #
@@ -49,12 +67,20 @@ def is_func_unbeartypeable(func: Callable) -> bool:
         # guarantee does *NOT* necessarily hold, we intentionally access that
         # attribute safely albeit somewhat more slowly via getattr().
         not getattr(func, '__annotations__', None) or
-        # This callable is decorated by the @typing.no_type_check decorator
-        # defining this dunder instance variable on this callable *OR*...
-        is_func_pep484_notypechecked(func) or
         # This callable is a @beartype-specific wrapper previously generated by
         # this decorator *OR*...
+        #
+        # Note that this test reduces to a single dictionary membership test
+        # and thus precedes the attribute lookup performed by the next test.
         is_func_beartyped(func) or
+        # This callable is decorated by the @typing.no_type_check decorator
+        # defining this dunder instance variable on this callable *OR*...
+        #
+        # Note that this test intentionally inlines the body of the
+        # is_func_pep484_notypechecked() tester, avoiding the cost of an
+        # additional function call on this hot path. Synchronize with that
+        # tester, please.
+        getattr(func, '__no_type_check__', False) is True or
         # Sphinx is currently autogenerating documentation (i.e., if this
         # decorator has been called from a Python call stack invoked by the
         # "autodoc" extension bundled with the optional third-party build-time
@@ -65,6 +91,13 @@ def is_func_unbeartypeable(func: Callable) -> bool:
         # @beartype frequently raises exceptions at decoration time. Why?
         # Because mocking subverts our assumptions and expectations about
         # classes used as annotations.
+        #
+        # Note that this test is intentionally performed last. Although this
+        # test reduces to an O(1) lookup of the "sys.modules" dictionary when
+        # Sphinx is *NOT* autogenerating documentation, this test otherwise
+        # reduces to an O(n) search up the call stack. Since the result of
+        # this test depends on the current call stack, this result is
+        # intentionally *NOT* memoized across calls.
         is_sphinx_autodocing()
     )
 
@@ -89,7 +122,17 @@ def is_func_beartyped(func: Callable) -> bool:
 
     # Return true only if this callable is a @beartype-specific wrapper
     # previously generated by this decorator.
-    return hasattr(func, '__beartype_wrapper')
+    #
+    # Note that this tester intentionally probes the "__dict__" dunder
+    # dictionary of this callable rather than calling the hasattr() builtin.
+    # The set_func_beartyped() setter below writes this attribute directly into
+    # that dictionary. Since hasattr() both walks the full descriptor and
+    # method resolution order (MRO) lookup chain *AND* silently squelches all
+    # exceptions raised during that walk, this single dictionary membership
+    # test is substantially faster. Since callables implemented in C (e.g.,
+    # builtins) commonly declare *NO* such dictionary, this tester defaults to
+    # the empty dictionary for safety.
+    return '__beartype_wrapper' in getattr(func, '__dict__', DICT_EMPTY)
 
 # ....................{ SETTERS                            }....................
 def set_func_beartyped(func: Callable) -> None:
@@ -105,7 +148,22 @@ def set_func_beartyped(func: Callable) -> None:
         Callable to be modified.
     '''
 
+    # Dunder dictionary of this callable if this callable declares one *OR*
+    # "None" otherwise (e.g., if this callable is implemented in C).
+    func_dict = getattr(func, '__dict__', None)
+
     # Declare this callable to be generated by @beartype, which tests for the
     # existence of this attribute above to avoid re-decorating callables
     # already decorated by @beartype by efficiently reducing to a noop.
-    func.__beartype_wrapper = True  # type: ignore[attr-defined]
+    #
+    # If this callable declares a dunder dictionary, write this attribute
+    # directly into that dictionary for parity with the is_func_beartyped()
+    # tester above. Note that dict.setdefault() both tests for and adds this
+    # attribute in a single dictionary probe, avoiding a redundant write if
+    # this callable was already declared to be generated by @beartype.
+    if func_dict is not None:
+        func_dict.setdefault('__beartype_wrapper', True)
+    # Else, this callable declares *NO* dunder dictionary. In this case, fall
+    # back to the standard attribute protocol.
+    else:
+        func.__beartype_wrapper = True  # type: ignore[attr-defined]
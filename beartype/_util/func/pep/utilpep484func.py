@@ -36,4 +36,7 @@ def is_func_pep484_notypechecked(func: Callable) -> bool:
 
     # Return true only if that callable declares a dunder attribute hopefully
     # *ONLY* declared on that callable by the @typing.no_type_check decorator.
+    #
+    # Note that the is_func_unbeartypeable() tester inlines this test for
+    # efficiency. Synchronize changes here with that tester, please.
     return getattr(func, '__no_type_check__', False) is True
@@ -132,12 +132,23 @@ def is_hint_pep484_ignorable_or_none(
         from beartype._util.hint.pep.utilpepget import get_hint_pep_args
         from beartype._util.hint.utilhinttest import is_hint_ignorable
 
-        # Return true only if one or more child hints of this union are
-        # recursively ignorable. See the function docstring.
-        return any(
-            is_hint_ignorable(hint_child)
-            for hint_child in get_hint_pep_args(hint)
-        )
+        # For each child hint of this union...
+        #
+        # Note that this iteration is intentionally implemented as an explicit
+        # loop rather than by passing a generator comprehension to the any()
+        # builtin, avoiding the cost of creating and repeatedly resuming a
+        # generator frame. Note also that the deferred import above already
+        # binds the is_hint_ignorable() tester as a fast local.
+        for hint_child in get_hint_pep_args(hint):
+            # If this child hint is recursively ignorable, return true. See the
+            # function docstring.
+            if is_hint_ignorable(hint_child):
+                return True
+            # Else, this child hint is unignorable. Continue to the next.
+
+        # Else, *NO* child hints of this union are ignorable. In this case,
+        # return false.
+        return False
     # Else, this hint is *NOT* a PEP 484-compliant union.
     #
     # If this hint is a PEP 484-compliant generic...
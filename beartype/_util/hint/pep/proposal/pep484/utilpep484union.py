@@ -13,8 +13,17 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype.typing import Union
+from beartype._util.cache.utilcachecall import callable_cached
+
+# ....................{ PRIVATE ~ globals                  }....................
+_union_getitem = Union.__getitem__  # pyright: ignore[reportGeneralTypeIssues]
+'''
+:meth:`typing.Union.__getitem__` dunder method bound to the
+:attr:`typing.Union` singleton, globalized for negligible efficiency.
+'''
 
 # ....................{ MAKERS                             }....................
+@callable_cached
 def make_hint_pep484_union(hints: tuple) -> object:
     '''
     :pep:`484`-compliant **union type hint** (:attr:`typing.Union`
@@ -23,9 +32,13 @@ def make_hint_pep484_union(hints: tuple) -> object:
     PEP-compliant type hint in this tuple if this tuple contains only one item,
     *or* raise an exception otherwise (i.e., if this tuple is empty).
 
-    This maker is intentionally *not* memoized (e.g., by the
-    :func:`callable_cached` decorator), as the :attr:`typing.Union` type hint
-    factory already caches its subscripted arguments.
+    This maker is memoized for efficiency. Although the :attr:`typing.Union`
+    type hint factory already caches its subscripted arguments, that factory
+    does so only after traversing considerable metaclass machinery on each
+    subscription. Since **PEP-noncompliant tuple unions** (i.e., tuples of one
+    or more classes and forward references to classes) are hashable, this maker
+    instead memoizes the union synthesized from each such tuple, reducing
+    repeated coercions of equivalent tuple unions to a single dictionary lookup.
 
     Parameters
     ----------
@@ -48,5 +61,16 @@ def make_hint_pep484_union(hints: tuple) -> object:
     '''
     assert isinstance(hints, tuple), f'{repr(hints)} not tuple.'
 
+    # If this tuple contains only one type, return this type as is. Since the
+    # "typing.Union" factory trivially reduces to this type in this case,
+    # avoid the needless overhead of subscripting that factory.
+    #
+    # Note that this optimization is intentionally restricted to types. That
+    # factory non-trivially coerces other hints (e.g., "None" into
+    # "type(None)", strings into "typing.ForwardRef" objects).
+    if len(hints) == 1 and isinstance(hints[0], type):
+        return hints[0]
+    # Else, this tuple contains either two or more items *OR* one non-type.
+
     # These are the one-liners of our lives.
-    return Union.__getitem__(hints)  # pyright: ignore[reportGeneralTypeIssues]
+    return _union_getitem(hints)
@@ -22,6 +22,7 @@ from beartype.typing import NoReturn
 from beartype._data.hint.datahinttyping import TypeException
 from beartype._data.hint.pep.datapeprepr import (
     HINTS_PEP484_REPR_PREFIX_DEPRECATED)
+from beartype._data.hint.pep.sign.datapepsigncls import HintSign
 from beartype._data.hint.pep.sign.datapepsignset import (
     HINT_SIGNS_SUPPORTED,
     HINT_SIGNS_TYPE_MIMIC,
@@ -483,7 +484,7 @@ def is_hint_pep_deprecated(hint: object) -> bool:
     return hint_repr_bare in HINTS_PEP484_REPR_PREFIX_DEPRECATED
 
 # ....................{ TESTERS ~ ignorable                }....................
-def is_hint_pep_ignorable(hint: object) -> bool:
+def is_hint_pep_ignorable(hint: object, hint_sign: HintSign) -> bool:
     '''
     ``True`` only if the passed object is a **deeply ignorable PEP-compliant
     type hint** (i.e., PEP-compliant type hint shown to be ignorable only after
@@ -498,6 +499,10 @@ def is_hint_pep_ignorable(hint: object) -> bool:
     ----------
     hint : object
         Object to be inspected.
+    hint_sign : HintSign
+        **Sign** (i.e., arbitrary object uniquely identifying this hint),
+        previously decided by the parent
+        :func:`beartype._util.hint.utilhinttest.is_hint_ignorable` tester.
 
     Returns
     ----------
@@ -517,13 +522,8 @@ def is_hint_pep_ignorable(hint: object) -> bool:
         superficially appearing to do so.
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._util.hint.pep.utilpepget import get_hint_pep_sign
     # print(f'Testing PEP hint {repr(hint)} deep ignorability...')
 
-    # Sign uniquely identifying this hint.
-    hint_sign = get_hint_pep_sign(hint)
-
     # For each PEP-specific function testing whether this hint is an ignorable
     # type hint fully compliant with that PEP...
     for is_hint_pep_ignorable_tester in _IS_HINT_PEP_IGNORABLE_TESTERS:
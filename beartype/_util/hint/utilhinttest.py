@@ -23,6 +23,13 @@ from beartype._util.hint.pep.utilpeptest import (
     is_hint_pep,
     is_hint_pep_supported,
 )
+from typing import (
+    Any as typing_Any,
+    Generic as typing_Generic,
+    Optional as typing_Optional,
+    Protocol as typing_Protocol,
+    Union as typing_Union,
+)
 
 # ....................{ RAISERS                            }....................
 def die_unless_hint(
@@ -89,14 +96,21 @@ def die_unless_hint(
 
     # If this hint is PEP-compliant, raise an exception only if this hint is
     # currently unsupported by @beartype.
+    #
+    # Note that this call is intentionally passed positional rather than
+    # keyword parameters to maximize efficiency.
     if is_hint_pep(hint):
-        die_if_hint_pep_unsupported(
-            hint=hint, exception_prefix=exception_prefix)
+        die_if_hint_pep_unsupported(hint, exception_prefix)
     # Else, this hint is *NOT* PEP-compliant. In this case...
 
     # Raise an exception only if this hint is also *NOT* PEP-noncompliant. By
     # definition, all PEP-noncompliant type hints are supported by @beartype.
-    die_unless_hint_nonpep(hint=hint, exception_prefix=exception_prefix)
+    #
+    # Note that the "exception_prefix" parameter is intentionally passed by
+    # keyword. Passing that parameter positionally would require also passing
+    # the optional "exception_cls" parameter preceding that parameter, coupling
+    # this validator to the default value of that parameter.
+    die_unless_hint_nonpep(hint, exception_prefix=exception_prefix)
 
 # ....................{ TESTERS                            }....................
 @callable_cached
@@ -142,7 +156,10 @@ def is_hint(hint: object) -> bool:
         is_hint_pep_supported(hint) if is_hint_pep(hint) else
         # This is a PEP-noncompliant type hint, which by definition is
         # necessarily supported by @beartype.
-        is_hint_nonpep(hint=hint, is_str_valid=True)
+        #
+        # Note that this call is intentionally passed positional rather than
+        # keyword parameters to maximize efficiency.
+        is_hint_nonpep(hint, True)
     )
 
 
@@ -165,6 +182,17 @@ def is_hint_ignorable(hint: object) -> bool:
         :data:`True` only if this type hint is ignorable.
     '''
 
+    # If this hint is a common shallowly ignorable singleton, return true.
+    #
+    # Note this technically constitutes an optional optimization. This test
+    # reduces to a single integer lookup, whereas the test below requires
+    # computing the machine-readable representation of this hint. Testing
+    # object identifiers rather than objects also avoids calling the
+    # non-trivial __hash__() and __eq__() dunder methods of this hint.
+    if id(hint) in _HINT_IDS_IGNORABLE_SHALLOW:
+        return True
+    # Else, this hint is *NOT* a common shallowly ignorable singleton.
+
     # Avoid circular import dependencies.
     from beartype._util.hint.utilhintget import get_hint_repr
 
@@ -173,15 +201,26 @@ def is_hint_ignorable(hint: object) -> bool:
         return True
     # Else, this hint is *NOT* shallowly ignorable.
 
+    # Avoid circular import dependencies.
+    from beartype._util.hint.pep.utilpepget import get_hint_pep_sign_or_none
+
+    # Sign uniquely identifying this hint if this hint is PEP-compliant *OR*
+    # "None" otherwise.
+    #
+    # Note that this sign is decided exactly once here and then passed to the
+    # is_hint_pep_ignorable() tester below, which would otherwise redecide this
+    # sign after the is_hint_pep() tester already decided this sign.
+    hint_sign = get_hint_pep_sign_or_none(hint)
+
     # If this hint is PEP-compliant...
-    if is_hint_pep(hint):
+    if hint_sign is not None:
         # Avoid circular import dependencies.
         from beartype._util.hint.pep.utilpeptest import (
             is_hint_pep_ignorable)
 
         # Defer to the function testing whether this hint is an ignorable
         # PEP-compliant type hint.
-        return is_hint_pep_ignorable(hint)
+        return is_hint_pep_ignorable(hint, hint_sign)
 
     # Else, this hint is PEP-noncompliant and thus *NOT* deeply ignorable.
     # Since this hint is also *NOT* shallowly ignorable, this hint is
@@ -334,3 +373,30 @@ def is_hint_needs_cls_stack(hint: object) -> bool:
     # See also the extensive timings documented at this StackOverflow question:
     #     https://stackoverflow.com/questions/4901523/whats-a-faster-operation-re-match-search-or-str-find
     return '.Self' in hint_repr
+
+# ....................{ PRIVATE ~ globals                  }....................
+_HINTS_IGNORABLE_SHALLOW = (
+    object,
+    typing_Any,
+    typing_Generic,
+    typing_Optional,
+    typing_Protocol,
+    typing_Union,
+)
+'''
+Tuple of the most common **shallowly ignorable type hints** (i.e., singletons
+whose machine-readable representations reside in the
+:data:`beartype._data.hint.pep.datapeprepr.HINTS_REPR_IGNORABLE_SHALLOW` set).
+
+This tuple strongly refers to these singletons, guaranteeing the object
+identifiers of these singletons to *never* be reused by other objects.
+'''
+
+
+_HINT_IDS_IGNORABLE_SHALLOW = frozenset(
+    id(hint) for hint in _HINTS_IGNORABLE_SHALLOW)
+'''
+Frozen set of the object identifiers of all hints in the
+:data:`._HINTS_IGNORABLE_SHALLOW` tuple, enabling the :func:`.is_hint_ignorable`
+tester to efficiently detect these hints by object identity.
+'''
@@ -28,12 +28,24 @@ bundled with Sphinx.
 '''
 
 # ....................{ TESTERS                            }....................
-def is_sphinx_autodocing() -> bool:
+def is_sphinx_autodocing(
+    # Hidden parameters, localized for negligible efficiency.
+    _SPHINX_AUTODOC_SUBPACKAGE_NAME=_SPHINX_AUTODOC_SUBPACKAGE_NAME,
+    _module_imported_names=module_imported_names,
+) -> bool:
     '''
     ``True`` only if Sphinx is currently **autogenerating documentation**
     (i.e., if this function has been called from a Python call stack invoked by
     the ``autodoc`` extension bundled with the optional third-party build-time
     :mod:`sphinx` package).
+
+    This tester is intentionally *not* memoized, as the result of this tester
+    depends on both the set of currently imported modules *and* the current
+    call stack. Notably, this tester is commonly called *before* the
+    ``autodoc`` extension has been imported (e.g., on decorating callables
+    defined by modules imported early at Sphinx startup). Permanently caching
+    the false result returned by this tester in that case would erroneously
+    prevent this tester from ever returning true later.
     '''
 
     # If the "autodoc" extension has *NOT* been imported, Sphinx by definition
@@ -43,7 +55,7 @@ def is_sphinx_autodocing() -> bool:
     # critical) optimization. This test is O(1) with negligible constants,
     # whereas the additional test below is O(n) with non-negligible constants.
     # Ergo, this efficient test short-circuits the inefficient test below.
-    if _SPHINX_AUTODOC_SUBPACKAGE_NAME not in module_imported_names:
+    if _SPHINX_AUTODOC_SUBPACKAGE_NAME not in _module_imported_names:
         return False
     # Else, the "autodoc" extension has been imported. Since this does *NOT*
     # conclusively imply that Sphinx is currently autogenerating documentation,
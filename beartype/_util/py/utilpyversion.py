@@ -10,10 +10,20 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                            }....................
-from sys import version_info
+from sys import (
+    hexversion,
+    version_info,
+)
 
 # ....................{ CONSTANTS ~ at least               }....................
-IS_PYTHON_AT_LEAST_4_0 = version_info >= (4, 0)
+# Note that these globals are intentionally decided by comparing the integer
+# "sys.hexversion" (e.g., 0x030B04F0 under Python 3.11.4) against the integer
+# prefixing the corresponding version. Doing so reduces each global to a single
+# integer comparison rather than a tuple comparison against the
+# "sys.version_info" named tuple. Each global is also intentionally decided
+# independently of all other globals for clarity.
+
+IS_PYTHON_AT_LEAST_4_0 = hexversion >= 0x04000000
 '''
 :data:`True` only if the active Python interpreter targets at least Python
 4.0.0.
@@ -25,7 +35,7 @@ IS_PYTHON_AT_LEAST_4_0 = version_info >= (4, 0)
 #* Remove this global.
 #* Remove all decorators resembling:
 #  @skip_if_python_version_less_than('3.12.0')
-IS_PYTHON_AT_LEAST_3_12 = IS_PYTHON_AT_LEAST_4_0 or version_info >= (3, 12)
+IS_PYTHON_AT_LEAST_3_12 = hexversion >= 0x030C0000
 '''
 :data:`True` only if the active Python interpreter targets at least Python
 3.12.0.
@@ -37,7 +47,7 @@ IS_PYTHON_AT_LEAST_3_12 = IS_PYTHON_AT_LEAST_4_0 or version_info >= (3, 12)
 #* Remove this global.
 #* Remove all decorators resembling:
 #  @skip_if_python_version_less_than('3.11.0')
-IS_PYTHON_AT_LEAST_3_11 = IS_PYTHON_AT_LEAST_3_12 or version_info >= (3, 11)
+IS_PYTHON_AT_LEAST_3_11 = hexversion >= 0x030B0000
 '''
 :data:`True` only if the active Python interpreter targets at least Python
 3.11.0.
@@ -59,7 +69,7 @@ IS_PYTHON_AT_MOST_3_10 = not IS_PYTHON_AT_LEAST_3_11
 #* Remove this global.
 #* Remove all decorators resembling:
 #  @skip_if_python_version_less_than('3.10.0')
-IS_PYTHON_AT_LEAST_3_10 = IS_PYTHON_AT_LEAST_3_11 or version_info >= (3, 10)
+IS_PYTHON_AT_LEAST_3_10 = hexversion >= 0x030A0000
 '''
 :data:`True` only if the active Python interpreter targets at least Python
 3.10.0.
@@ -80,7 +90,7 @@ IS_PYTHON_AT_MOST_3_9 = not IS_PYTHON_AT_LEAST_3_10
 #* Remove this global.
 #* Remove all decorators resembling:
 #  @skip_if_python_version_less_than('3.9.0')
-IS_PYTHON_AT_LEAST_3_9 = IS_PYTHON_AT_LEAST_3_10 or version_info >= (3, 9)
+IS_PYTHON_AT_LEAST_3_9 = hexversion >= 0x03090000
 '''
 :data:`True` only if the active Python interpreter targets at least Python
 3.9.0.
@@ -99,7 +109,7 @@ IS_PYTHON_AT_MOST_3_8 = not IS_PYTHON_AT_LEAST_3_9
 #FIXME: After dropping Python 3.8 support:
 #* Refactor all code conditionally testing this global to be unconditional.
 #* Remove this global.
-IS_PYTHON_3_8 = version_info[:2] == (3, 8)
+IS_PYTHON_3_8 = 0x03080000 <= hexversion < 0x03090000
 '''
 :data:`True` only if the active Python interpreter targets exactly Python 3.8.x.
 '''
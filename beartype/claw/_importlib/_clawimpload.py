@@ -19,8 +19,8 @@ from ast import (
 )
 from beartype.claw._ast.clawastmain import BeartypeNodeTransformer
 from beartype.claw._importlib.clawimpcache import (  # type: ignore[attr-defined]
-    cache_from_source_beartype,
     cache_from_source_original,
+    make_cache_from_source_beartype,
 )
 from beartype.roar import BeartypeClawImportAstException
 from beartype.typing import Optional
@@ -31,7 +31,6 @@ from importlib import (  # type: ignore[attr-defined]
     _bootstrap_external,  # pyright: ignore[reportGeneralTypeIssues]
 )
 from importlib.machinery import SourceFileLoader
-from importlib.util import decode_source
 from types import CodeType
 
 # ....................{ CLASSES                            }....................
@@ -210,8 +209,9 @@ class BeartypeSourceFileLoader(SourceFileLoader):
 
           #. Temporarily monkey-patches (i.e., replaces) the
              private :func:`importlib._bootstrap_external.cache_from_source`
-             function with our beartype-specific
-             :func:`_cache_from_source_beartype` variant.
+             function with our beartype-specific variant created by the
+             :func:`.make_cache_from_source_beartype` factory for the beartype
+             configuration with which to type-check that module.
           #. Calls the superclass :meth:`SourceLoader.get_code` method, which:
 
              #. Calls our override of the lower-level superclass
@@ -244,9 +244,11 @@ class BeartypeSourceFileLoader(SourceFileLoader):
           including the name and version of the active Python interpreter).
 
         This monkey-patch suffixes ``{optimization_markers}`` by
-        :data:`.BEARTYPE_OPTIMIZATION_MARKER`, which additionally uniquifies the
-        filename of this bytecode file to the abstract syntax tree (AST)
-        transformation applied by this version of :mod:`beartype`. Why? Because
+        :data:`.BEARTYPE_OPTIMIZATION_MARKER` and a digest of the beartype
+        configuration with which to type-check that module, which additionally
+        uniquifies the filename of this bytecode file to the abstract syntax
+        tree (AST) transformation applied by this version of :mod:`beartype`
+        under that configuration. Why? Because
         external callers can trivially enable and disable that transformation
         for any module by either calling or not calling the
         :func:`beartype.claw.beartype_package` function with the name of a
@@ -368,7 +370,12 @@ class BeartypeSourceFileLoader(SourceFileLoader):
             #
             # Note that @agronholm (Alex Grönholm) claims that "the import lock
             # should make this monkey patch safe." We're trusting you here, man!
-            _bootstrap_external.cache_from_source = cache_from_source_beartype
+            #
+            # Note also that the patched function is specific to this
+            # configuration, as the AST transformation applied by the
+            # source_to_code() method depends on this configuration.
+            _bootstrap_external.cache_from_source = (
+                make_cache_from_source_beartype(conf))
 
             # Attempt to defer to the superclass method.
             try:
@@ -442,12 +449,18 @@ class BeartypeSourceFileLoader(SourceFileLoader):
                 data=data, path=path, _optimize=_optimize)  # pyright: ignore[reportGeneralTypeIssues]
         # Else, that module has been registered for type-checking.
 
-        # Plaintext decoded contents of that module.
-        module_source = decode_source(data)
-
-        # Abstract syntax tree (AST) parsed from these contents.
+        # Abstract syntax tree (AST) parsed from the undecoded contents of
+        # that module.
+        #
+        # Note that these contents are intentionally passed as is to the
+        # compile() builtin rather than first decoded by the
+        # importlib.util.decode_source() function. Like the superclass
+        # source_to_code() method, compile() already decodes byte arrays in
+        # accordance with PEP 263-compliant encoding declarations and
+        # byte-order marks (BOMs). Decoding these contents beforehand would
+        # only needlessly allocate a string the size of that module.
         module_ast = compile(
-            module_source,
+            data,
             path,
             'exec',
             PyCF_ONLY_AST,
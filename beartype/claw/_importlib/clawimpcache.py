@@ -15,8 +15,13 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                            }....................
 from beartype.claw._clawmagic import BEARTYPE_OPTIMIZATION_MARKER
 from beartype.roar import BeartypeClawImportConfException
-from beartype.typing import Dict
+from beartype.typing import (
+    Callable,
+    Dict,
+)
 from beartype._conf.confcls import BeartypeConf
+from beartype._util.cache.utilcachecall import callable_cached
+from hashlib import sha256
 from pprint import pformat
 
 # Original cache_from_source() function defined by the private (*gulp*)
@@ -200,30 +205,93 @@ class ModuleNameToBeartypeConf(Dict[str, 'BeartypeConf']):
                 f'hooked modules include:\n\t{pformat(self)}'
             ) from exception
 
-# ....................{ CACHERS                            }....................
-#FIXME: Unit test us up, please.
-def cache_from_source_beartype(*args, **kwargs) -> str:
+# ....................{ FACTORIES                          }....................
+@callable_cached
+def make_cache_from_source_beartype(
+    conf: BeartypeConf) -> Callable[..., str]:
     '''
     Beartype-specific variant of the
     :func:`importlib._bootstrap_external.cache_from_source` function applying a
-    beartype-specific optimization marker to that function.
+    beartype-specific optimization marker unique to the passed beartype
+    configuration to that function.
 
     This, in turn, ensures that submodules residing in packages registered by a
     prior call to the :func:`beartype_package` function are
     compiled to files with the filetype
-    ``".pyc{optimization}_{BEARTYPE_OPTIMIZATION_MARKER}"``, where
-    ``{optimization}`` is the original ``optimization`` parameter passed to this
-    function call.
+    ``".pyc{optimization}{BEARTYPE_OPTIMIZATION_MARKER}c{conf_digest}"``,
+    where:
+
+    * ``{optimization}`` is the original ``optimization`` parameter passed to
+      that function call.
+    * ``{conf_digest}`` is a hexadecimal digest of the machine-readable
+      representation of this configuration.
+
+    Why also uniquify these filenames to this configuration? Because the
+    abstract syntax tree (AST) transformation applied by the
+    :class:`beartype.claw._ast.clawastmain.BeartypeNodeTransformer` subclass
+    depends on this configuration (e.g., the
+    :attr:`beartype.BeartypeConf.claw_is_pep526` option). Compiling submodules
+    hooked under one configuration to the same bytecode files as submodules
+    hooked under another configuration would erroneously persist the former
+    transformation to the latter -- even *after* changing the configuration
+    passed to the relevant call to the :func:`beartype_package` function.
+
+    This factory is memoized for efficiency. Since beartype configurations are
+    self-caching singletons, this factory creates at most one such function
+    for each such configuration.
+
+    Parameters
+    ----------
+    conf : BeartypeConf
+        Beartype configuration with which to type-check hooked submodules.
+
+    Returns
+    ----------
+    Callable[..., str]
+        Beartype-specific variant of the
+        :func:`importlib._bootstrap_external.cache_from_source` function
+        specific to this configuration.
     '''
+    assert isinstance(conf, BeartypeConf), f'{repr(conf)} not configuration.'
+
+    # Beartype-specific optimization marker unique to both this version of
+    # beartype *AND* this configuration.
+    #
+    # Note that:
+    # * Python requires all optimization markers to be alphanumeric. Since
+    #   hexadecimal digests are alphanumeric, this marker is also alphanumeric.
+    # * The representation of this configuration is intentionally digested
+    #   rather than merely hashed by the hash() builtin. Whereas the latter is
+    #   randomized across Python processes (e.g., due to string hashing), the
+    #   former is stable across Python processes and thus suitable for
+    #   embedding in the filenames of on-disk bytecode files.
+    BEARTYPE_CONF_OPTIMIZATION_MARKER = (
+        f'{BEARTYPE_OPTIMIZATION_MARKER}c'
+        f'{sha256(repr(conf).encode()).hexdigest()[:16]}'
+    )
+
+    def cache_from_source_beartype(*args, **kwargs) -> str:
+        '''
+        Beartype-specific variant of the
+        :func:`importlib._bootstrap_external.cache_from_source` function
+        applying a beartype-specific optimization marker unique to the
+        beartype configuration passed to the parent factory.
+        '''
+
+        # Original optimization parameter passed to this function call if any
+        # *OR* the empty string otherwise.
+        NONBEARTYPE_OPTIMIZATION_MARKER = kwargs.get('optimization', '')
 
-    # Original optimization parameter passed to this function call if any *OR*
-    # the empty string otherwise.
-    NONBEARTYPE_OPTIMIZATION_MARKER = kwargs.get('optimization', '')
+        # New optimization parameter applied by this monkey-patch of that
+        # function, uniquifying that parameter with a beartype-specific suffix.
+        kwargs['optimization'] = (
+            f'{NONBEARTYPE_OPTIMIZATION_MARKER}'
+            f'{BEARTYPE_CONF_OPTIMIZATION_MARKER}'
+        )
 
-    # New optimization parameter applied by this monkey-patch of that function,
-    # uniquifying that parameter with a beartype-specific suffix.
-    kwargs['optimization'] = (
-        f'{NONBEARTYPE_OPTIMIZATION_MARKER}{BEARTYPE_OPTIMIZATION_MARKER}')
+        # Defer to the implementation of the original cache_from_source()
+        # function.
+        return cache_from_source_original(*args, **kwargs)
 
-    # Defer to the implementation of the original cache_from_source() function.
-    return cache_from_source_original(*args, **kwargs)
+    # Return this function.
+    return cache_from_source_beartype
@@ -185,12 +185,20 @@ def make_package_names_from_args(
         if not isinstance(package_names, IterableABC):
             raise BeartypeClawHookException(
                 f'beartype_packages() '
-                f'package names {repr(package_name)} not iterable.'
+                f'package names {repr(package_names)} not iterable.'
             )
         # Else, this package names is iterable.
-        #
+
+        # Coerce this iterable into a tuple. Doing so guarantees that this
+        # iterable is iterated exactly once, which matters for single-use
+        # iterables (e.g., generators) that would otherwise be exhausted by the
+        # validation performed below *BEFORE* the parent call iterates over
+        # these package names to (un)register them. Moreover, the emptiness
+        # test performed below is only meaningful for sized iterables.
+        package_names = tuple(package_names)
+
         # If *NO* package names were passed, raise an exception.
-        elif not package_names:
+        if not package_names:
             raise BeartypeClawHookException(
                 'beartype_packages() package names empty.')
         # Else, one or more package names were passed.
@@ -235,30 +235,68 @@ def get_package_conf_or_none(package_name: str) -> Optional[BeartypeConf]:
         * Else, :data:`None`.
     '''
 
+    assert isinstance(package_name, str), f'{repr(package_name)} not string.'
+
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # CAUTION: Synchronize with the iter_packages_trie() generator, please.
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+    # Note that this getter is called by our import path hook on the
+    # importation of *EVERY* sourceful module, regardless of whether that
+    # module is hooked or not. For efficiency, this getter intentionally
+    # inlines the trie traversal performed by the iter_packages_trie()
+    # generator rather than calling that generator. Doing so avoids the cost of
+    # creating and repeatedly resuming a generator frame *AND* avoids holding
+    # the lock below across each suspension of that generator.
+
     # Avoid circular import dependencies.
-    from beartype.claw._clawstate import claw_state
+    from beartype.claw._clawstate import (
+        claw_lock,
+        claw_state,
+    )
+
+    # List of each unqualified basename comprising this name, split from this
+    # fully-qualified name on "." delimiters.
+    package_basenames = package_name.split('.')
+
+    # With a submodule-specific thread-safe reentrant lock...
+    with claw_lock:
+        # Current subtrie of the global trie describing the currently iterated
+        # basename of this package, initialized to this global trie itself.
+        subpackages_trie: Optional[PackagesTrie] = claw_state.packages_trie
+
+        # Beartype configuration registered for the currently iterated package,
+        # defaulting to the beartype configuration registered for the global
+        # trie applicable to *ALL* packages if an external caller previously
+        # called the public beartype.claw.beartype_all() function *OR* "None"
+        # otherwise (i.e., if that function has yet to be called).
+        subpackage_conf = subpackages_trie.conf_if_hooked  # type: ignore[union-attr]
 
-    # Beartype configuration registered for the currently iterated package,
-    # defaulting to the beartype configuration registered for the global trie
-    # applicable to *ALL* packages if an external caller previously called the
-    # public beartype.claw.beartype_all() function *OR* "None" otherwise (i.e.,
-    # if that function has yet to be called).
-    subpackage_conf = claw_state.packages_trie.conf_if_hooked
-
-    # For each subpackages trie describing each parent package transitively
-    # containing this package (as well as that of that package itself)...
-    for subpackages_trie in iter_packages_trie(package_name):
-        # Beartype configuration registered with either...
-        subpackage_conf = (
-            # That parent package if any *OR*...
-            #
-            # Since that parent package is more granular (i.e., unique) than
-            # any transitive parent package of that parent package, the
-            # former takes precedence over the latter when defined.
-            subpackages_trie.conf_if_hooked or
-            # A transitive parent package of that parent package if any.
-            subpackage_conf
-        )
+        # For each unqualified basename of each parent package transitively
+        # containing this package (as well as that of that package itself)...
+        for package_basename in package_basenames:
+            # Current subtrie of that trie describing that parent package if
+            # that parent package was registered by a prior call to the
+            # hook_packages() function *OR* "None" otherwise (i.e., if that
+            # parent package has yet to be registered).
+            subpackages_trie = subpackages_trie.get(package_basename)  # type: ignore[union-attr]
+
+            # If that parent package has yet to be registered, halt iteration.
+            if subpackages_trie is None:
+                break
+            # Else, that parent package was previously registered.
+
+            # Beartype configuration registered with either...
+            subpackage_conf = (
+                # That parent package if any *OR*...
+                #
+                # Since that parent package is more granular (i.e., unique) than
+                # any transitive parent package of that parent package, the
+                # former takes precedence over the latter when defined.
+                subpackages_trie.conf_if_hooked or
+                # A transitive parent package of that parent package if any.
+                subpackage_conf
+            )
 
     # Return this beartype configuration if any *OR* "None" otherwise.
     return subpackage_conf
@@ -312,6 +350,10 @@ def iter_packages_trie(package_name: str) -> Iterable[PackagesTrie]:
     # simplicity and readability.
     package_basenames = package_name.split('.')
 
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # CAUTION: Synchronize with the get_package_conf_or_none() getter, please.
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
     # With a submodule-specific thread-safe reentrant lock...
     with claw_lock:
         # Current subtrie of the global trie describing the currently iterated
@@ -7,7 +7,7 @@
 **Beartype-generated wrapper function utility unit tests.**
 
 This submodule unit tests the public API of the private
-:mod:`beartype._util.utilfunc.lib.utilbeartypefunc` submodule.
+:mod:`beartype._util.func.mod.utilbeartypefunc` submodule.
 '''
 
 # ....................{ IMPORTS                           }....................
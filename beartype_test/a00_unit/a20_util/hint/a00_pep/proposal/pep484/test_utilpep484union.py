@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2023 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** :pep:`484`-compliant **union type hint utility unit tests.**
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.hint.pep.proposal.pep484.utilpep484union` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS ~ makers                    }....................
+def test_make_hint_pep484_union() -> None:
+    '''
+    Test the
+    :func:`beartype._util.hint.pep.proposal.pep484.utilpep484union.make_hint_pep484_union`
+    maker.
+    '''
+
+    # Defer test-specific imports.
+    from beartype.typing import Union
+    from beartype._util.hint.pep.proposal.pep484.utilpep484union import (
+        make_hint_pep484_union)
+    from pytest import raises
+
+    # Union synthesized from a tuple of two or more types.
+    hint_union = make_hint_pep484_union((int, str))
+
+    # Assert this maker synthesizes the expected union.
+    assert hint_union == Union[int, str]
+
+    # Assert this maker returns the same union when passed an equivalent tuple.
+    assert make_hint_pep484_union((int, str)) is hint_union
+
+    # Assert this maker reduces a tuple of one type to that type.
+    assert make_hint_pep484_union((bytes,)) is bytes
+
+    # Assert this maker coerces a tuple of one non-type as "typing.Union" does.
+    assert make_hint_pep484_union((None,)) is type(None)
+
+    # Assert this maker raises the expected exception when passed the empty
+    # tuple.
+    with raises(TypeError):
+        make_hint_pep484_union(())
@@ -98,6 +98,10 @@ def test_coerce_hint_any() -> None:
         #     False
         assert coerce_hint_any(list[int]) is hint_pep585
 
+        # Assert this coercer preserves that first instance as is when
+        # repeatedly passed that instance.
+        assert coerce_hint_any(hint_pep585) is hint_pep585
+
     # ..................{ PEP 604                            }..................
     # If the active Python interpreter targets Python >= 3.10 and thus supports
     # PEP 604...
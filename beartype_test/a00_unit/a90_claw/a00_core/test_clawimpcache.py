@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2023 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **import hook module cache unit tests.**
+
+This submodule unit tests the public API of the private
+:mod:`beartype.claw._importlib.clawimpcache` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS ~ factories                  }....................
+def test_make_cache_from_source_beartype() -> None:
+    '''
+    Test the
+    :func:`beartype.claw._importlib.clawimpcache.make_cache_from_source_beartype`
+    factory.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import BeartypeConf
+    from beartype.claw._clawmagic import BEARTYPE_OPTIMIZATION_MARKER
+    from beartype.claw._importlib.clawimpcache import (
+        make_cache_from_source_beartype)
+
+    # Arbitrary source filename.
+    SOURCE_FILENAME = 'the_awful_shadow.py'
+
+    # Variants of the cache_from_source() function specific to the default
+    # configuration and an arbitrary non-default configuration.
+    cache_from_source_default = make_cache_from_source_beartype(
+        BeartypeConf())
+    cache_from_source_nondefault = make_cache_from_source_beartype(
+        BeartypeConf(claw_is_pep526=False))
+
+    # Assert this factory memoizes these variants.
+    assert make_cache_from_source_beartype(BeartypeConf()) is (
+        cache_from_source_default)
+
+    # Bytecode filenames produced by these variants.
+    bytecode_filename_default = cache_from_source_default(SOURCE_FILENAME)
+    bytecode_filename_nondefault = cache_from_source_nondefault(
+        SOURCE_FILENAME)
+
+    # Assert these filenames are specific to this version of beartype.
+    assert BEARTYPE_OPTIMIZATION_MARKER in bytecode_filename_default
+    assert BEARTYPE_OPTIMIZATION_MARKER in bytecode_filename_nondefault
+
+    # Assert these filenames are specific to these configurations.
+    assert bytecode_filename_default != bytecode_filename_nondefault
+
+    # Assert these variants preserve the passed optimization marker.
+    assert '.opt-2' in cache_from_source_default(
+        SOURCE_FILENAME, optimization='2')
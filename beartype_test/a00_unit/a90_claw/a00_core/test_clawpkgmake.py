@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2023 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **import hook factory unit tests.**
+
+This submodule unit tests the public API of the private
+:mod:`beartype.claw._pkg._clawpkgmake` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS ~ factories                  }....................
+def test_make_package_names_from_args() -> None:
+    '''
+    Test the
+    :func:`beartype.claw._pkg._clawpkgmake.make_package_names_from_args`
+    factory.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import BeartypeConf
+    from beartype.claw._pkg.clawpkgenum import BeartypeClawCoverage
+    from beartype.claw._pkg._clawpkgmake import make_package_names_from_args
+    from beartype.roar import BeartypeClawHookException
+    from pytest import raises
+
+    # Tuple of arbitrary package names.
+    PACKAGE_NAMES = ('the_sleepless.soul', 'that_perishes')
+
+    # Assert this factory preserves a single-use iterable of package names
+    # rather than exhausting that iterable while validating these names.
+    assert make_package_names_from_args(
+        claw_coverage=BeartypeClawCoverage.PACKAGES_MANY,
+        conf=BeartypeConf(),
+        package_names=(package_name for package_name in PACKAGE_NAMES),
+    ) == PACKAGE_NAMES
+
+    # Assert this factory raises the expected exception when passed an empty
+    # single-use iterable of package names.
+    with raises(BeartypeClawHookException):
+        make_package_names_from_args(
+            claw_coverage=BeartypeClawCoverage.PACKAGES_MANY,
+            conf=BeartypeConf(),
+            package_names=iter(()),
+        )